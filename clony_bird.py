@@ -3,29 +3,112 @@
 Clony Bird - Terminal Version
 A terminal-based Flappy Bird clone using curses library (no display required)
 """
+import asyncio
+import collections
 import curses
 import random
-import time
 import sys
 
 # Game constants (adjusted for terminal)
 GRAVITY = 0.6  # Increased for faster falling
 JUMP_STRENGTH = -0.8  # Further reduced for gentle, controlled jumps
 PIPE_SPEED = 1
+# Bird physics runs in integer fixed point: positions and velocities are in
+# 1/POSITION_SCALE rows, so the per-frame update does no float arithmetic
+POSITION_SCALE = 1000
+GRAVITY_Q = round(GRAVITY * 0.12 * POSITION_SCALE)  # Velocity gained per frame (72)
+JUMP_Q = round(JUMP_STRENGTH * POSITION_SCALE)  # Velocity set by a jump (-800)
+VEL_MAX_Q = 3 * POSITION_SCALE  # Maximum downward velocity (3.0 rows per frame)
+VEL_MIN_Q = -3 * POSITION_SCALE // 2  # Maximum upward velocity (-1.5 rows per frame)
 PIPE_GAP = 8  # Gap height in terminal rows
 PIPE_WIDTH = 3  # Pipe width in terminal columns
 PIPE_SPACING = 25  # Space between pipes
+GAP_BATCH_SIZE = 256  # Pipe gap positions drawn from the random generator at a time
 COLLISION_MARGIN = 0.3  # Small margin for collision detection (more forgiving on edges)
+FRAME_TIME = 0.05  # Seconds per frame (20 FPS)
+MAX_CATCH_UP_FRAMES = 5  # Longest stall (in frames) the game catches up on instead of skipping
+LEVEL_UP_MESSAGE_TIME = 3.0  # Seconds the level up message stays on screen
 BIRD_CHAR = "🐦"  # Bird character (fallback to 'O' if emoji not supported)
-PIPE_CHAR = "█"
 GROUND_CHAR = "═"
 
+# Menu text is fixed, so it and the art widths used for centering are set up
+# once here instead of every time a menu is laid out
+
+# ASCII art for "CLONY BIRD" - provided by user
+TITLE_ART = (
+    "  ______   __                                      _______   __                  __ ",
+    " /      \\ /  |                                    /       \\ /  |                /  |",
+    "/$$$$$$  |$$ |  ______   _______   __    __       $$$$$$$  |$$/   ______    ____$$ |",
+    "$$ |  $$/ $$ | /      \\ /       \\ /  |  /  |      $$ |__$$ |/  | /      \\  /    $$ |",
+    "$$ |      $$ |/$$$$$$  |$$$$$$$  |$$ |  $$ |      $$    $$< $$ |/$$$$$$  |/$$$$$$$ |",
+    "$$ |   __ $$ |$$ |  $$ |$$ |  $$ |$$ |  $$ |      $$$$$$$  |$$ |$$ |  $$/ $$ |  $$ |",
+    "$$ \\__/  |$$ |$$ \\__$$ |$$ |  $$ |$$ \\__$$ |      $$ |__$$ |$$ |$$ |      $$ \\__$$ |",
+    "$$    $$/ $$ |$$    $$/ $$ |  $$ |$$    $$ |      $$    $$/ $$ |$$ |      $$    $$ |",
+    " $$$$$$/  $$/  $$$$$$/  $$/   $$/  $$$$$$$ |      $$$$$$$/  $$/ $$/        $$$$$$$/ ",
+    "                                  /  \\__$$ |                                        ",
+    "                                  $$    $$/                                         ",
+    "                                   $$$$$$/                                          ",
+)
+TITLE_ART_WIDTH = max(len(line) for line in TITLE_ART)
+
+# ASCII art for "GAME OVER"
+GAME_OVER_ART = (
+    "   ____                        ___",
+    "  / ___| __ _ _ __ ___   ___  / _ \\__   _____ _ __",
+    " | |  _ / _` | '_ ` _ \\ / _ \\| | | \\ \\ / / _ \\ '__|",
+    " | |_| | (_| | | | | | |  __/| |_| |\\ V /  __/ |",
+    "  \\____|\\__,_|_| |_| |_|\\___|  \\___/  \\_/ \\___|_|",
+)
+GAME_OVER_ART_WIDTH = max(len(line) for line in GAME_OVER_ART)
+
+# Welcome screen instructions
+WELCOME_INSTRUCTIONS = (
+    "",
+    "Use LEFT/RIGHT arrows, A/D, or 1/2/3 to select difficulty",
+    "Press SPACE or W to start the game",
+    "",
+    "Game Info:",
+    "  • Navigate through pipes and advance through 5 levels",
+    "  • Each level requires 30 points to complete",
+    "  • Speed increases with each level",
+    "",
+    "Controls:",
+    "  SPACE / W  - Jump",
+    "  R          - Restart (after game over)",
+    "  Q / ESC    - Quit",
+)
+
+class Pipe:
+    """A pipe pair (slots keep per-frame attribute access cheap)"""
+    __slots__ = ('x', 'gap_top', 'gap_bottom', 'pad')
+    
+    def __init__(self, x, gap_y, pad):
+        self.pad = pad  # The pipe drawn on its own, copied to the screen each frame
+        self.place(x, gap_y)
+    
+    def place(self, x, gap_y):
+        """Put the pipe at x with its gap centered on gap_y"""
+        self.x = x
+        # The gap never moves vertically, so its bounds are worked out once here
+        # instead of in every collision check and draw
+        self.gap_top = gap_y - PIPE_GAP // 2
+        self.gap_bottom = gap_y + PIPE_GAP // 2
+
 class ClonyBird:
+    # Base pipe speed per level (1, 1.5, 2, 2.5, 3), before the difficulty multiplier
+    _LEVEL_SPEEDS = tuple(PIPE_SPEED + level * 0.5 for level in range(5))
+    
     def __init__(self, stdscr):
         self.stdscr = stdscr
         curses.curs_set(0)  # Hide cursor
-        self.stdscr.nodelay(1)  # Non-blocking input
-        self.stdscr.timeout(50)  # 50ms timeout for input
+        # Don't let doupdate() poll stdin for typeahead: each frame goes out in one
+        # write instead of being interrupted (and dropped) while keys are pending
+        curses.typeahead(-1)
+        # ncurses flushes its output after every cursor move until the screen has
+        # been suspended and resumed once; one endwin()/refresh() cycle up front
+        # lets each doupdate() reach the terminal as a single write
+        curses.endwin()
+        stdscr.refresh()
         
         # Get terminal dimensions
         self.height, self.width = stdscr.getmaxyx()
@@ -40,7 +123,11 @@ class ClonyBird:
         self.points_per_level = 30
         self.game_over = False
         self.game_started = False
-        self.level_up_message_time = 0  # Track when to hide level up message
+        self.showing_level_up = False  # Cleared by a timer after LEVEL_UP_MESSAGE_TIME
+        self._needs_redraw = True  # Set whenever something on screen may have changed
+        self._welcome_ops_by_index = {}  # Prebuilt welcome screens, one per selected bird
+        self._game_over_ops = None  # Prebuilt game over screen for the current game
+        self._level_up_timer = None
         
         # Bird selection (now integrated into welcome screen)
         self.selected_bird_index = 0  # 0 = Easy, 1 = Medium, 2 = Hard
@@ -55,12 +142,8 @@ class ClonyBird:
         
         # Bird position (relative to center)
         self.bird_x = self.width // 4
-        self.bird_y = self.height // 2
-        self.bird_velocity = 0
-        
-        # Create pipes list
-        self.pipes = []
-        self.create_initial_pipes()
+        self._bird_y_q = self.height // 2 * POSITION_SCALE
+        self._bird_vel_q = 0
         
         # Try to enable colors
         try:
@@ -71,21 +154,43 @@ class ClonyBird:
             curses.init_pair(3, curses.COLOR_CYAN, -1)    # Sky (transparent bg)
             curses.init_pair(4, curses.COLOR_WHITE, -1)   # Text (transparent bg)
             curses.init_pair(5, curses.COLOR_RED, -1)     # Game Over (transparent bg)
+            # Sky is the window background colour
+            self.stdscr.bkgd(' ', curses.color_pair(3))
             self.colors_enabled = True
         except:
             self.colors_enabled = False
         
-        # Set background color for better performance
-        try:
-            if self.colors_enabled:
-                self.stdscr.bkgd(' ', curses.color_pair(3))
-        except:
-            pass
+        # Colour attribute for each role, looked up once. Without colours they are
+        # all 0, so they can be combined with other attributes either way.
+        if self.colors_enabled:
+            self._attr_bird = curses.color_pair(1)
+            self._attr_pipe = curses.color_pair(2)
+            self._attr_sky = curses.color_pair(3)
+            self._attr_text = curses.color_pair(4)
+            self._attr_over = curses.color_pair(5)
+        else:
+            self._attr_bird = self._attr_pipe = self._attr_sky = self._attr_text = self._attr_over = 0
+        
+        # Pipe cell for vline(): a reversed space renders as a solid block in any
+        # locale (vline() only takes single-byte characters, not a multibyte glyph).
+        # The colour is folded into the chtype once instead of on every call.
+        self._pipe_cell = ord(' ') | curses.A_REVERSE | self._attr_pipe
+        
+        # Sky and ground never change, so they are drawn once into a pad
+        self.build_background()
+        
+        # Possible gap centers, and a batch of them drawn ahead of time
+        self._gap_range = range(self.height // 4, 3 * self.height // 4 + 1)
+        self._gap_batch = []
+        
+        # Pipes ordered left to right, so only the front one can leave the screen
+        self.pipes = collections.deque()
+        self.create_initial_pipes()
         
         # Check if terminal supports emoji and set default bird
+        # (addstr alone is enough to probe; the first draw() paints over it)
         try:
             self.stdscr.addstr(0, 0, "✈️")
-            self.stdscr.refresh()
             self.bird_char = self.bird_options[0]["char"]  # Default to first bird
         except:
             # Fallback characters if emoji not supported
@@ -95,16 +200,46 @@ class ClonyBird:
                 {"char": "C", "name": "Hard", "difficulty": 1.2, "desc": "10% faster"},
             ]
             self.bird_char = self.bird_options[0]["char"]
+        
+        # Keys are read from their own pad: getch() on a pad never refreshes
+        # it, so reading input can't push a half-drawn frame to the terminal
+        self._input_win = curses.newpad(1, 1)
+        self._input_win.keypad(1)
+        self._input_win.nodelay(1)
+    
+    def random_gap_y(self):
+        """Pick a gap position (center of gap) for a new pipe"""
+        # random.choices() draws a whole batch in one call, which is much cheaper
+        # per value than a randint() for every pipe
+        if not self._gap_batch:
+            self._gap_batch = random.choices(self._gap_range, k=GAP_BATCH_SIZE)
+        return self._gap_batch.pop()
     
     def create_pipe(self, x):
-        """Create a pipe pair data structure"""
-        # Gap position (center of gap)
-        gap_y = random.randint(self.height // 4, 3 * self.height // 4)
-        return {
-            'x': x,
-            'gap_y': gap_y,
-            'passed': False
-        }
+        """Create a pipe pair"""
+        # Pad rows match screen rows; row 0 and the ground row are never copied
+        pad = curses.newpad(self.height - 1, PIPE_WIDTH)
+        pad.bkgd(' ', self._attr_sky)
+        pipe = Pipe(x, self.random_gap_y(), pad)
+        self.draw_pipe_pad(pipe)
+        return pipe
+    
+    def draw_pipe_pad(self, pipe):
+        """Draw a pipe into its pad (only needed when its gap is placed)"""
+        # The gap is left as sky, so copying the pad also clears what the pipe
+        # covered. Each column is one vline() run: a multi-line string can't stand
+        # in for a run, as addstr() treats '\n' as clear-to-end-of-line plus a
+        # return to column 0.
+        pad = pipe.pad
+        pad.erase()
+        top_length = pipe.gap_top - 1
+        gap_bottom = pipe.gap_bottom
+        bottom_length = self.height - 2 - gap_bottom
+        for x in range(PIPE_WIDTH):
+            if top_length > 0:
+                pad.vline(1, x, self._pipe_cell, top_length)
+            if bottom_length > 0:
+                pad.vline(gap_bottom + 1, x, self._pipe_cell, bottom_length)
     
     def create_initial_pipes(self):
         """Create initial set of pipes"""
@@ -112,18 +247,18 @@ class ClonyBird:
         for i in range(3):
             x = start_x + i * PIPE_SPACING
             self.pipes.append(self.create_pipe(x))
+        # New pipes are always appended on the right, so track that edge directly
+        self._last_pipe_x = x
     
     def jump(self):
         """Make the bird jump"""
         if self.game_started and not self.game_over:
-            self.bird_velocity = JUMP_STRENGTH
+            self._bird_vel_q = JUMP_Q
     
-    def get_pipe_speed(self):
-        """Get pipe speed based on current level and difficulty"""
-        # Level 1: speed 1, Level 2: speed 1.5, Level 3: speed 2, Level 4: speed 2.5, Level 5: speed 3
-        base_speed = PIPE_SPEED + (self.level - 1) * 0.5
+    def update_pipe_speed(self):
+        """Recompute pipe speed after the level or difficulty changes"""
         # Apply difficulty multiplier (10% increase per difficulty level)
-        return base_speed * self.difficulty_multiplier
+        self._pipe_speed = self._LEVEL_SPEEDS[self.level - 1] * self.difficulty_multiplier
     
     def select_bird(self, index):
         """Select a bird and set difficulty"""
@@ -131,181 +266,182 @@ class ClonyBird:
             self.selected_bird_index = index
             self.bird_char = self.bird_options[index]["char"]
             self.difficulty_multiplier = self.bird_options[index]["difficulty"]
+            self.update_pipe_speed()
     
     def start_game(self):
         """Start the game"""
         if not self.game_started:
             self.game_started = True
     
-    def update_bird(self):
-        """Update bird position and velocity"""
+    def step(self):
+        """Advance the game by one frame"""
         if not self.game_started or self.game_over:
             return
         
+        self._needs_redraw = True
+        self.update_bird()
+        if not self.game_over:
+            self.update_pipes()
+    
+    def update_bird(self):
+        """Update bird position and velocity"""
         # Apply gravity (increased rate for faster falling)
-        self.bird_velocity += GRAVITY * 0.12
+        velocity = self._bird_vel_q + GRAVITY_Q
         
         # Cap maximum velocities to prevent too fast movement
-        if self.bird_velocity > 3.0:  # Increased maximum downward velocity for faster falling
-            self.bird_velocity = 3.0
-        if self.bird_velocity < -1.5:  # Maximum upward velocity (prevent overshooting, matches reduced jump)
-            self.bird_velocity = -1.5
+        velocity = VEL_MAX_Q if velocity > VEL_MAX_Q else (VEL_MIN_Q if velocity < VEL_MIN_Q else velocity)
+        self._bird_vel_q = velocity
         
         # Update position
-        self.bird_y += self.bird_velocity
+        bird_y = self._bird_y_q = self._bird_y_q + velocity
         
         # Check boundaries (with some margin from edges)
-        if self.bird_y < 1 or self.bird_y >= self.height - 2:
+        if bird_y < POSITION_SCALE or bird_y >= (self.height - 2) * POSITION_SCALE:
             self.end_game()
     
     def update_pipes(self):
         """Update pipe positions"""
-        if not self.game_started or self.game_over:
-            return
-        
-        current_speed = self.get_pipe_speed()
-        
+        current_speed = self._pipe_speed
+        # A pipe is passed once its right edge is behind the bird; the bird
+        # never moves horizontally, so the threshold is computed once per frame
+        pass_x = self.bird_x - PIPE_WIDTH
+        # The bird is within a pipe's x range (widened by a small margin for more
+        # forgiving horizontal collision) while
+        #     pipe.x - COLLISION_MARGIN <= bird_x < pipe.x + PIPE_WIDTH + COLLISION_MARGIN
+        # which is rearranged into bounds on pipe.x that are computed once per frame
+        hit_min_x = self.bird_x - PIPE_WIDTH - COLLISION_MARGIN
+        hit_max_x = self.bird_x + COLLISION_MARGIN
+        bird_y = self._bird_y_q
+        self._last_pipe_x -= current_speed
+        
+        # The loop only touches the pipes themselves; points and a hit are
+        # collected in locals and applied to the game state once afterwards
+        scored = 0
+        collided = False
         for pipe in self.pipes:
             # Move pipes at speed based on level
-            pipe['x'] -= current_speed
+            old_x = pipe.x
+            pipe.x = old_x - current_speed
             
-            # Check if bird passed the pipe
-            if not pipe['passed'] and pipe['x'] + PIPE_WIDTH < self.bird_x:
-                pipe['passed'] = True
-                self.level_score += 1
-                self.total_score += 1
-                
-                # Check if level complete
-                if self.level_score >= self.points_per_level:
-                    self.level_up()
+            # Check if bird passed the pipe: pipes only move left, so this is the
+            # one frame where it crosses the threshold (no per-pipe flag needed)
+            if pipe.x < pass_x <= old_x:
+                scored += 1
             
-            # Check collision
-            if self.check_collision(pipe):
-                self.end_game()
-                return
+            # Check collision: inside the pipe's x range but outside the gap (strict
+            # vertical check - no margin for gap boundaries, the bird must actually
+            # be in the gap)
+            if hit_min_x < pipe.x <= hit_max_x and (
+                    bird_y < pipe.gap_top * POSITION_SCALE or bird_y > pipe.gap_bottom * POSITION_SCALE):
+                collided = True
+                break
+        
+        if scored:
+            self.level_score += scored
+            self.total_score += scored
+            
+            # Check if level complete
+            if self.level_score >= self.points_per_level:
+                self.level_up()
         
-        # Remove pipes that are off screen and add new ones
-        self.pipes = [p for p in self.pipes if p['x'] > -PIPE_WIDTH]
+        if collided:
+            self.end_game()
+            return
         
-        # Add new pipe if needed
-        if len(self.pipes) < 3:
-            last_x = max([p['x'] for p in self.pipes]) if self.pipes else self.width // 2
-            self.pipes.append(self.create_pipe(last_x + PIPE_SPACING))
+        # A pipe that scrolls off the left edge is reused in place as the next pipe
+        # on the right, so the set of pipes never has to be reallocated
+        pipes = self.pipes
+        while pipes[0].x <= -PIPE_WIDTH:
+            self._last_pipe_x += PIPE_SPACING
+            pipe = pipes[0]
+            pipe.place(self._last_pipe_x, self.random_gap_y())
+            self.draw_pipe_pad(pipe)
+            pipes.rotate(-1)
     
     def level_up(self):
         """Advance to next level"""
         if self.level < self.max_level:
             self.level += 1
             self.level_score = 0
-            self.level_up_message_time = 60  # Show message for ~3 seconds (60 frames at 50ms)
+            self.update_pipe_speed()
+            self.show_level_up_message()
         else:
             # Max level reached, keep playing but don't advance further
             self.level_score = self.points_per_level  # Cap at max
     
-    def check_collision(self, pipe):
-        """Check if bird collides with pipe"""
-        pipe_x = pipe['x']
-        gap_y = pipe['gap_y']
-        gap_top = gap_y - PIPE_GAP // 2
-        gap_bottom = gap_y + PIPE_GAP // 2
-        
-        # Check if bird is within pipe's x range (with small margin for more forgiving horizontal collision)
-        # This gives the bird a tiny bit of leeway when passing through
-        if pipe_x - COLLISION_MARGIN <= self.bird_x < pipe_x + PIPE_WIDTH + COLLISION_MARGIN:
-            # Check if bird is outside gap (strict vertical check - no margin for gap boundaries)
-            # This ensures the bird must actually be in the gap
-            if self.bird_y < gap_top or self.bird_y > gap_bottom:
-                return True
-        
-        return False
+    def show_level_up_message(self):
+        """Show the level up message and schedule it to be hidden"""
+        if self._level_up_timer:
+            self._level_up_timer.cancel()
+        self.showing_level_up = True
+        loop = asyncio.get_running_loop()
+        self._level_up_timer = loop.call_later(LEVEL_UP_MESSAGE_TIME, self.hide_level_up_message)
+    
+    def hide_level_up_message(self):
+        """Hide the level up message"""
+        if self._level_up_timer:
+            self._level_up_timer.cancel()
+            self._level_up_timer = None
+        if self.showing_level_up:
+            self.showing_level_up = False
+            self._needs_redraw = True
+    
+    def add_op(self, ops, y, x, text, attr):
+        """Append a draw operation, clipped so it can never write outside the window"""
+        if 0 <= y < self.height and 0 <= x < self.width:
+            # The bottom-right cell can't be written (the cursor has nowhere to go)
+            room = self.width - x - (1 if y == self.height - 1 else 0)
+            ops.append((y, x, text[:room], attr))
+    
+    def draw_ops(self, ops):
+        """Replay prebuilt (y, x, text, attr) draw operations (already clipped)"""
+        addstr = self.stdscr.addstr
+        for y, x, text, attr in ops:
+            addstr(y, x, text, attr)
     
     def draw_welcome_screen(self):
         """Draw the welcome/start screen"""
+        # The screen only changes with the selected bird, so each variant is built once
+        ops = self._welcome_ops_by_index.get(self.selected_bird_index)
+        if ops is None:
+            ops = self._welcome_ops_by_index[self.selected_bird_index] = self.build_welcome_ops()
+        self.draw_ops(ops)
+    
+    def build_welcome_ops(self):
+        """Lay out the welcome/start screen as a list of draw operations"""
+        ops = []
         center_y = self.height // 2
         center_x = self.width // 2
         
-        # ASCII art for "CLONY BIRD" - provided by user
-        title_lines = [
-            "  ______   __                                      _______   __                  __ ",
-            " /      \\ /  |                                    /       \\ /  |                /  |",
-            "/$$$$$$  |$$ |  ______   _______   __    __       $$$$$$$  |$$/   ______    ____$$ |",
-            "$$ |  $$/ $$ | /      \\ /       \\ /  |  /  |      $$ |__$$ |/  | /      \\  /    $$ |",
-            "$$ |      $$ |/$$$$$$  |$$$$$$$  |$$ |  $$ |      $$    $$< $$ |/$$$$$$  |/$$$$$$$ |",
-            "$$ |   __ $$ |$$ |  $$ |$$ |  $$ |$$ |  $$ |      $$$$$$$  |$$ |$$ |  $$/ $$ |  $$ |",
-            "$$ \\__/  |$$ |$$ \\__$$ |$$ |  $$ |$$ \\__$$ |      $$ |__$$ |$$ |$$ |      $$ \\__$$ |",
-            "$$    $$/ $$ |$$    $$/ $$ |  $$ |$$    $$ |      $$    $$/ $$ |$$ |      $$    $$ |",
-            " $$$$$$/  $$/  $$$$$$/  $$/   $$/  $$$$$$$ |      $$$$$$$/  $$/ $$/        $$$$$$$/ ",
-            "                                  /  \\__$$ |                                        ",
-            "                                  $$    $$/                                         ",
-            "                                   $$$$$$/                                          ",
-        ]
-        
-        # Find the longest line for proper centering
-        max_line_length = max(len(line) for line in title_lines)
-        
         # Welcome text
         welcome_text = "WELCOME!"
         
         # Difficulty selector section
         difficulty_title = "SELECT DIFFICULTY:"
         
-        # Instructions
-        instructions = [
-            "",
-            "Use LEFT/RIGHT arrows, A/D, or 1/2/3 to select difficulty",
-            "Press SPACE or W to start the game",
-            "",
-            "Game Info:",
-            "  • Navigate through pipes and advance through 5 levels",
-            "  • Each level requires 30 points to complete",
-            "  • Speed increases with each level",
-            "",
-            "Controls:",
-            "  SPACE / W  - Jump",
-            "  R          - Restart (after game over)",
-            "  Q / ESC    - Quit",
-        ]
-        
         # Draw title - center based on longest line
         # Adjust start position for taller ASCII art (12 lines)
         start_y = max(1, center_y - 10)
-        for i, line in enumerate(title_lines):
+        title_attr = self._attr_bird | curses.A_BOLD
+        for i, line in enumerate(TITLE_ART):
             if start_y + i < self.height - 1:
                 # Center based on max line length
-                x = center_x - max_line_length // 2
+                x = center_x - TITLE_ART_WIDTH // 2
                 # Trim line if it's too wide for the terminal
                 display_line = line[:self.width - x] if x + len(line) > self.width else line
                 if x >= 0 and x + len(display_line) <= self.width:
-                    try:
-                        if self.colors_enabled:
-                            self.stdscr.addstr(start_y + i, x, display_line, curses.color_pair(1) | curses.A_BOLD)
-                        else:
-                            self.stdscr.addstr(start_y + i, x, display_line, curses.A_BOLD)
-                    except:
-                        pass
+                    self.add_op(ops, start_y + i, x, display_line, title_attr)
         
         # Draw welcome text
-        welcome_y = start_y + len(title_lines) + 1
+        welcome_y = start_y + len(TITLE_ART) + 1
         welcome_x = center_x - len(welcome_text) // 2
         if welcome_y < self.height - 1 and welcome_x >= 0:
-            try:
-                if self.colors_enabled:
-                    self.stdscr.addstr(welcome_y, welcome_x, welcome_text, curses.color_pair(5) | curses.A_BOLD | curses.A_BLINK)
-                else:
-                    self.stdscr.addstr(welcome_y, welcome_x, welcome_text, curses.A_BOLD | curses.A_BLINK)
-            except:
-                pass
+            self.add_op(ops, welcome_y, welcome_x, welcome_text, self._attr_over | curses.A_BOLD | curses.A_BLINK)
         
         # Draw difficulty selector
         diff_y = welcome_y + 2
         diff_title_x = center_x - len(difficulty_title) // 2
-        try:
-            if self.colors_enabled:
-                self.stdscr.addstr(diff_y, diff_title_x, difficulty_title, curses.color_pair(4) | curses.A_BOLD)
-            else:
-                self.stdscr.addstr(diff_y, diff_title_x, difficulty_title, curses.A_BOLD)
-        except:
-            pass
+        self.add_op(ops, diff_y, diff_title_x, difficulty_title, self._attr_text | curses.A_BOLD)
         
         # Draw bird options
         bird_start_y = diff_y + 2
@@ -317,76 +453,47 @@ class ClonyBird:
             # Highlight selected bird
             is_selected = (i == self.selected_bird_index)
             attr = curses.A_BOLD if is_selected else curses.A_NORMAL
-            color = curses.color_pair(1) if is_selected else curses.color_pair(4)
+            color = self._attr_bird if is_selected else self._attr_text
+            label_attr = color | attr
             
             # Draw selection indicator
             if is_selected:
-                try:
-                    indicator = ">>>"
-                    self.stdscr.addstr(bird_start_y - 1, x - len(indicator) // 2, indicator, color | attr)
-                except:
-                    pass
-            
-            # Draw bird character
-            try:
-                if self.colors_enabled:
-                    self.stdscr.addstr(bird_start_y, x - 1, bird["char"], color | attr)
-                else:
-                    self.stdscr.addstr(bird_start_y, x - 1, bird["char"], attr)
-            except:
-                pass
+                indicator = ">>>"
+                self.add_op(ops, bird_start_y - 1, x - len(indicator) // 2, indicator, color | attr)
             
-            # Draw bird name
-            name_x = x - len(bird["name"]) // 2
-            try:
-                if self.colors_enabled:
-                    self.stdscr.addstr(bird_start_y + 1, name_x, bird["name"], color | attr)
-                else:
-                    self.stdscr.addstr(bird_start_y + 1, name_x, bird["name"], attr)
-            except:
-                pass
+            # Draw bird character and name
+            self.add_op(ops, bird_start_y, x - 1, bird["char"], label_attr)
+            self.add_op(ops, bird_start_y + 1, x - len(bird["name"]) // 2, bird["name"], label_attr)
             
             # Draw difficulty description
             desc_x = x - len(bird["desc"]) // 2
-            try:
-                if self.colors_enabled:
-                    self.stdscr.addstr(bird_start_y + 2, desc_x, bird["desc"], curses.color_pair(4))
-                else:
-                    self.stdscr.addstr(bird_start_y + 2, desc_x, bird["desc"])
-            except:
-                pass
+            desc_attr = self._attr_text
+            self.add_op(ops, bird_start_y + 2, desc_x, bird["desc"], desc_attr)
         
         # Draw instructions
         inst_start_y = bird_start_y + 5
-        for i, line in enumerate(instructions):
-            if inst_start_y + i < self.height - 2:
+        inst_attr = self._attr_text
+        for i, line in enumerate(WELCOME_INSTRUCTIONS):
+            if line and inst_start_y + i < self.height - 2:
                 x = center_x - len(line) // 2
                 if x >= 0 and x + len(line) < self.width:
-                    try:
-                        if self.colors_enabled:
-                            self.stdscr.addstr(inst_start_y + i, x, line, curses.color_pair(4))
-                        else:
-                            self.stdscr.addstr(inst_start_y + i, x, line)
-                    except:
-                        pass
+                    self.add_op(ops, inst_start_y + i, x, line, inst_attr)
+        
+        return ops
     
     def draw_game_over_screen(self):
         """Draw the game over screen"""
+        # Stats are final once the game is over, so the screen is built once per game
+        if self._game_over_ops is None:
+            self._game_over_ops = self.build_game_over_ops()
+        self.draw_ops(self._game_over_ops)
+    
+    def build_game_over_ops(self):
+        """Lay out the game over screen as a list of draw operations"""
+        ops = []
         center_y = self.height // 2
         center_x = self.width // 2
         
-        # ASCII art for "GAME OVER" - find max length for alignment
-        game_over_lines = [
-            "   ____                        ___",
-            "  / ___| __ _ _ __ ___   ___  / _ \\__   _____ _ __",
-            " | |  _ / _` | '_ ` _ \\ / _ \\| | | \\ \\ / / _ \\ '__|",
-            " | |_| | (_| | | | | | |  __/| |_| |\\ V /  __/ |",
-            "  \\____|\\__,_|_| |_| |_|\\___|  \\___/  \\_/ \\___|_|",
-        ]
-        
-        # Find the longest line for proper centering
-        max_line_length = max(len(line) for line in game_over_lines)
-        
         # Stats
         selected_bird = self.bird_options[self.selected_bird_index]
         stats = [
@@ -405,156 +512,120 @@ class ClonyBird:
         
         # Draw game over title - center based on longest line
         start_y = max(2, center_y - 6)
-        for i, line in enumerate(game_over_lines):
+        title_attr = self._attr_over | curses.A_BOLD
+        for i, line in enumerate(GAME_OVER_ART):
             if start_y + i < self.height - 1:
                 # Center based on max line length
-                x = center_x - max_line_length // 2
+                x = center_x - GAME_OVER_ART_WIDTH // 2
                 if x >= 0 and x + len(line) < self.width:
-                    try:
-                        if self.colors_enabled:
-                            self.stdscr.addstr(start_y + i, x, line, curses.color_pair(5) | curses.A_BOLD)
-                        else:
-                            self.stdscr.addstr(start_y + i, x, line, curses.A_BOLD)
-                    except:
-                        pass
+                    self.add_op(ops, start_y + i, x, line, title_attr)
         
         # Draw stats
-        stats_start_y = start_y + len(game_over_lines) + 2
+        stats_start_y = start_y + len(GAME_OVER_ART) + 2
+        stats_attr = self._attr_text | curses.A_BOLD
         for i, stat in enumerate(stats):
             if stats_start_y + i < self.height - 1:
                 x = center_x - len(stat) // 2
                 if x >= 0 and x + len(stat) < self.width:
-                    try:
-                        if self.colors_enabled:
-                            self.stdscr.addstr(stats_start_y + i, x, stat, curses.color_pair(4) | curses.A_BOLD)
-                        else:
-                            self.stdscr.addstr(stats_start_y + i, x, stat, curses.A_BOLD)
-                    except:
-                        pass
+                    self.add_op(ops, stats_start_y + i, x, stat, stats_attr)
         
         # Draw instructions
         inst_start_y = stats_start_y + len(stats) + 1
+        inst_attr = self._attr_text
         for i, line in enumerate(instructions):
-            if inst_start_y + i < self.height - 1:
+            if line and inst_start_y + i < self.height - 1:
                 x = center_x - len(line) // 2
                 if x >= 0 and x + len(line) < self.width:
-                    try:
-                        if self.colors_enabled:
-                            self.stdscr.addstr(inst_start_y + i, x, line, curses.color_pair(4))
-                        else:
-                            self.stdscr.addstr(inst_start_y + i, x, line)
-                    except:
-                        pass
+                    self.add_op(ops, inst_start_y + i, x, line, inst_attr)
+        
+        return ops
     
-    def draw(self):
-        """Draw everything on screen - optimized to reduce flickering"""
-        # Use erase() instead of clear() for better performance
-        self.stdscr.erase()
+    def build_background(self):
+        """Draw the static scene (sky and ground) into the background pad"""
+        self.bg_pad = curses.newpad(self.height, self.width)
         
-        # Draw ground (only one line, efficient)
+        # The ground is one preformatted row. addstr() can't write the bottom-right
+        # cell (the cursor has nowhere to go), so that cell is inserted instead.
         ground_y = self.height - 1
-        ground_line = GROUND_CHAR * self.width
+        ground_line = GROUND_CHAR * (self.width - 1)
+        self.bg_pad.bkgd(' ', self._attr_sky)
+        self.bg_pad.addstr(ground_y, 0, ground_line, self._attr_pipe)
+        self.bg_pad.insstr(ground_y, self.width - 1, GROUND_CHAR, self._attr_pipe)
+        
+        # Screen areas (top, left, bottom, right) drawn over the background by the
+        # last frame; only these are restored from the pad before the next frame
+        self._full_screen = (0, 0, self.height - 1, self.width - 1)
+        self._damage = [self._full_screen]
+    
+    def draw(self):
+        """Draw everything on screen - optimized to reduce flickering"""
+        # Every coordinate below is kept inside the window, so the individual
+        # calls can't fail; one guard covers the whole frame instead
         try:
-            if self.colors_enabled:
-                self.stdscr.addstr(ground_y, 0, ground_line[:self.width], curses.color_pair(2))
-            else:
-                self.stdscr.addstr(ground_y, 0, ground_line[:self.width])
-        except:
-            pass
-        
-        # Only draw game elements if game is started and not over
-        if self.game_started and not self.game_over:
-            # Draw pipes (optimized - draw by lines instead of pixels)
-            pipe_line = PIPE_CHAR * PIPE_WIDTH
-            pipe_attr = curses.color_pair(2) if self.colors_enabled else 0
+            # Restore the cached sky and ground only where the last frame drew
+            restore = self.bg_pad.overwrite
+            for top, left, bottom, right in self._damage:
+                restore(self.stdscr, top, left, top, left, bottom, right)
+            damage = self._damage = []
             
-            for pipe in self.pipes:
-                pipe_x = int(pipe['x'])
-                gap_y = int(pipe['gap_y'])
-                gap_top = gap_y - PIPE_GAP // 2
-                gap_bottom = gap_y + PIPE_GAP // 2
-                
-                # Only draw if pipe is visible
-                if -PIPE_WIDTH <= pipe_x < self.width:
-                    # Calculate visible area
-                    start_x = max(0, pipe_x)
-                    end_x = min(self.width, pipe_x + PIPE_WIDTH)
-                    visible_width = end_x - start_x
-                    offset = start_x - pipe_x
+            # Only draw game elements if game is started and not over
+            if self.game_started and not self.game_over:
+                # Draw pipes: each one is copied from its pad in a single call
+                stdscr = self.stdscr
+                width = self.width
+                bottom_end = self.height - 2
+                for pipe in self.pipes:
+                    pipe_x = int(pipe.x)
                     
-                    if visible_width > 0:
-                        visible_pipe = pipe_line[offset:offset + visible_width]
-                        
-                        # Top pipe - draw line by line
-                        for y in range(1, gap_top):
-                            if 0 <= y < self.height - 1:
-                                try:
-                                    if self.colors_enabled:
-                                        self.stdscr.addstr(y, start_x, visible_pipe, pipe_attr)
-                                    else:
-                                        self.stdscr.addstr(y, start_x, visible_pipe)
-                                except:
-                                    pass
-                        
-                        # Bottom pipe - draw line by line
-                        for y in range(gap_bottom + 1, self.height - 1):
-                            if 0 <= y < self.height - 1:
-                                try:
-                                    if self.colors_enabled:
-                                        self.stdscr.addstr(y, start_x, visible_pipe, pipe_attr)
-                                    else:
-                                        self.stdscr.addstr(y, start_x, visible_pipe)
-                                except:
-                                    pass
+                    # Only copy the visible columns (a pipe entering from the left
+                    # is copied from further into its pad)
+                    left = max(0, pipe_x)
+                    right = min(width, pipe_x + PIPE_WIDTH) - 1
+                    if left > right:
+                        continue
+                    
+                    damage.append((1, left, bottom_end, right))
+                    pipe.pad.overwrite(stdscr, 1, left - pipe_x, 1, left, bottom_end, right)
+                
+                # Draw bird
+                bird_x = int(self.bird_x)
+                bird_y = self._bird_y_q // POSITION_SCALE
+                if 0 <= bird_x < self.width - 1 and 0 <= bird_y < self.height - 1:
+                    damage.append((bird_y, bird_x, bird_y, bird_x + 1))  # Emoji may be 2 cells wide
+                    self.stdscr.addstr(bird_y, bird_x, self.bird_char, self._attr_bird)
+                
+                # Draw score and level info (only during gameplay), clipped to the width
+                level_text = f"Level: {self.level}/{self.max_level}"
+                score_text = f"Level Score: {self.level_score}/{self.points_per_level} | Total: {self.total_score}"
+                text_width = self.width - 3
+                damage.append((0, 2, 1, self.width - 2))
+                self.stdscr.addnstr(0, 2, level_text, text_width, self._attr_text | curses.A_BOLD)
+                self.stdscr.addnstr(1, 2, score_text, text_width, self._attr_text)
             
-            # Draw bird
-            bird_x = int(self.bird_x)
-            bird_y = int(self.bird_y)
-            if 0 <= bird_x < self.width and 0 <= bird_y < self.height - 1:
-                try:
-                    if self.colors_enabled:
-                        self.stdscr.addstr(bird_y, bird_x, self.bird_char, curses.color_pair(1))
-                    else:
-                        self.stdscr.addstr(bird_y, bird_x, self.bird_char)
-                except:
-                    pass
+            # Draw level up message (only during active gameplay)
+            if self.game_started and not self.game_over and self.showing_level_up:
+                msg = f"LEVEL {self.level}!"
+                msg_x = (self.width - len(msg)) // 2
+                msg_y = self.height // 2
+                damage.append((msg_y, msg_x, msg_y, msg_x + len(msg) - 1))
+                self.stdscr.addstr(msg_y, msg_x, msg, self._attr_over | curses.A_BOLD | curses.A_BLINK)
             
-            # Draw score and level info (only during gameplay)
-            level_text = f"Level: {self.level}/{self.max_level}"
-            score_text = f"Level Score: {self.level_score}/{self.points_per_level} | Total: {self.total_score}"
-            try:
-                if self.colors_enabled:
-                    self.stdscr.addstr(0, 2, level_text, curses.color_pair(4) | curses.A_BOLD)
-                    self.stdscr.addstr(1, 2, score_text, curses.color_pair(4))
-                else:
-                    self.stdscr.addstr(0, 2, level_text, curses.A_BOLD)
-                    self.stdscr.addstr(1, 2, score_text)
-            except:
-                pass
-        
-        # Draw level up message (only during active gameplay)
-        if self.game_started and not self.game_over and self.level_up_message_time > 0:
-            msg = f"LEVEL {self.level}!"
-            msg_x = (self.width - len(msg)) // 2
-            msg_y = self.height // 2
-            try:
-                if self.colors_enabled:
-                    self.stdscr.addstr(msg_y, msg_x, msg, curses.color_pair(5) | curses.A_BOLD | curses.A_BLINK)
-                else:
-                    self.stdscr.addstr(msg_y, msg_x, msg, curses.A_BOLD | curses.A_BLINK)
-            except:
-                pass
-            self.level_up_message_time -= 1
-        
-        # Draw welcome screen or game over screen
-        if not self.game_started:
-            self.draw_welcome_screen()
-        elif self.game_over:
-            self.draw_game_over_screen()
+            # Draw welcome screen or game over screen (they cover most of the screen)
+            if not self.game_started:
+                damage.append(self._full_screen)
+                self.draw_welcome_screen()
+            elif self.game_over:
+                damage.append(self._full_screen)
+                self.draw_game_over_screen()
+        except curses.error:
+            # Terminal changed under us mid-frame; show what was drawn and
+            # restore the whole background next frame
+            self._damage = [self._full_screen]
         
         # Use noutrefresh + doupdate for better performance (reduces flickering)
         self.stdscr.noutrefresh()
         curses.doupdate()
+        self._needs_redraw = False
     
     def end_game(self):
         """End the game"""
@@ -567,21 +638,32 @@ class ClonyBird:
         self.level = 1
         self.level_score = 0
         self.total_score = 0
-        self.level_up_message_time = 0
+        self.hide_level_up_message()
         self.game_over = False
+        self._game_over_ops = None
         self.game_started = False
         self.selected_bird_index = 0  # Reset to first bird
         self.select_bird(0)  # Reset bird and difficulty
-        self.bird_y = self.height // 2
-        self.bird_velocity = 0
-        self.pipes = []
+        self._bird_y_q = self.height // 2 * POSITION_SCALE
+        self._bird_vel_q = 0
+        self.pipes = collections.deque()
         self.create_initial_pipes()
     
     def handle_input(self):
-        """Handle keyboard input"""
+        """Handle every key waiting on stdin (called by the event loop when it is readable)"""
+        while True:
+            key = self._input_win.getch()
+            if key == -1:
+                return
+            self._key_pressed.set()
+            self._needs_redraw = True
+            if not self.handle_key(key):
+                self._quit.set()
+                return
+    
+    def handle_key(self, key):
+        """Handle a single key press"""
         try:
-            key = self.stdscr.getch()
-            
             # Quit functionality (works at any time)
             if key == ord('q') or key == ord('Q') or key == 27:  # ESC or Q
                 return False
@@ -619,20 +701,61 @@ class ClonyBird:
         return True
     
     def run(self):
-        """Main game loop - optimized for smooth rendering"""
-        while True:
-            if not self.handle_input():
-                break
+        """Run the game until the player quits"""
+        asyncio.run(self.run_async())
+    
+    async def run_async(self):
+        """Main game loop - fixed-rate physics, with rendering in its own task"""
+        loop = asyncio.get_running_loop()
+        self._quit = asyncio.Event()
+        self._key_pressed = asyncio.Event()
+        self._frame_ready = asyncio.Event()
+        loop.add_reader(sys.stdin.fileno(), self.handle_input)
+        physics = asyncio.create_task(self.physics_loop())
+        renderer = asyncio.create_task(self.render_loop())
+        try:
+            done, _ = await asyncio.wait((physics, renderer), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()  # Re-raise if either loop crashed
+        finally:
+            physics.cancel()
+            renderer.cancel()
+            loop.remove_reader(sys.stdin.fileno())
+            self.hide_level_up_message()
+    
+    async def physics_loop(self):
+        """Advance the game every FRAME_TIME (against the loop's monotonic clock) until quit"""
+        loop = asyncio.get_running_loop()
+        next_frame = loop.time()
+        while not self._quit.is_set():
+            if not self._needs_redraw and (self.game_over or not self.game_started):
+                # Nothing on the welcome or game over screen changes until a key is pressed
+                self._key_pressed.clear()
+                await self._key_pressed.wait()
+                next_frame = loop.time()
+                continue
             
-            # Only update game logic if game is started
-            if self.game_started:
-                self.update_bird()
-                self.update_pipes()
+            # Run every step that is due, so a slow render doesn't slow the game down;
+            # only after a long stall is the lost time dropped instead
+            now = loop.time()
+            if now - next_frame > MAX_CATCH_UP_FRAMES * FRAME_TIME:
+                next_frame = now
+            while next_frame <= now:
+                self.step()
+                next_frame += FRAME_TIME
             
+            # Hand the new state to the renderer; if it hasn't drawn the previous one
+            # yet, that stale frame is simply skipped
+            if self._needs_redraw:
+                self._frame_ready.set()
+            await asyncio.sleep(next_frame - loop.time())
+    
+    async def render_loop(self):
+        """Draw the latest game state each time the physics loop has advanced it"""
+        while True:
+            await self._frame_ready.wait()
+            self._frame_ready.clear()
             self.draw()
-            
-            # Reduced sleep time for smoother gameplay (less flickering)
-            time.sleep(0.03)  # 30ms for ~33 FPS
 
 def main(stdscr):
     """Main function wrapper for curses"""